@@ -2,28 +2,45 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import os
 import re
-import subprocess
 import sys
-from dataclasses import asdict
 from dataclasses import dataclass
-from pathlib import Path
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Collection
 from typing import Iterable
+from typing import Iterator
 from typing import Sequence
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 SEMVER_RE = re.compile(r"^([0-9]+)\.([0-9]+)\.([0-9]+)$")
 RELEASE_SUBJECT_RE = re.compile(
     r"^chore\(release\):\s*v[0-9]+\.[0-9]+\.[0-9]+([-.][0-9A-Za-z.-]+)?$",
     re.IGNORECASE,
 )
 BREAKING_SUBJECT_RE = re.compile(r"^[a-z0-9_-]+(\([^)]+\))?!:", re.IGNORECASE)
-BREAKING_BODY_RE = re.compile(r"(^|\n)BREAKING[ -]CHANGE:", re.IGNORECASE)
+BREAKING_BODY_RE = re.compile(r"^BREAKING[ -]CHANGE:", re.IGNORECASE | re.MULTILINE)
 FEATURE_SUBJECT_RE = re.compile(r"^feat(\([^)]+\))?:", re.IGNORECASE)
 RELEASABLE_SUBJECT_RE = re.compile(r"^(feat|fix|perf)(\([^)]+\))?!?:", re.IGNORECASE)
+# Single conventional-commit tokenizer covering the *_SUBJECT_RE rules above in one match.
+_SUBJECT_LEX = re.compile(
+    r"^(?:(?P<release>chore\(release\):\s*v[0-9]+\.[0-9]+\.[0-9]+(?:[-.][0-9A-Za-z.-]+)?$)"
+    r"|(?:(?P<feat>feat)|(?P<releasable>fix|perf)|[a-z0-9_-]+)(?:\([^)]+\))?(?P<breaking>!)?:)",
+    re.IGNORECASE,
+)
+# Unscoped, non-breaking prefixes that fix the kind without running _SUBJECT_LEX.
+_FEAT_PREFIXES = ("feat:",)
+_RELEASABLE_PREFIXES = ("fix:", "perf:")
+_SKIPPED_PREFIXES = ("build:", "chore:", "ci:", "docs:", "refactor:", "style:", "test:")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Commit:
     subject: str
     body: str = ""
@@ -38,40 +55,68 @@ class VersionResult:
 
 
 def parse_semver(version: str) -> tuple[int, int, int]:
-    match = SEMVER_RE.match(version.strip())
-    if not match:
-        raise ValueError(f"Invalid semver: {version}")
-    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+    # Equivalent to SEMVER_RE, but str.split avoids the regex engine on this hot path.
+    parts = version.strip().split(".")
+    if len(parts) == 3:
+        major, minor, patch = parts
+        if (major + minor + patch).isascii() and major.isdigit() and minor.isdigit() and patch.isdigit():
+            return int(major), int(minor), int(patch)
+    raise ValueError(f"Invalid semver: {version}")
 
 
 def is_release_commit(subject: str) -> bool:
     return RELEASE_SUBJECT_RE.match(subject.strip()) is not None
 
 
-def normalize_commits(raw_commits: Iterable[Commit | dict[str, str]]) -> list[Commit]:
-    commits: list[Commit] = []
+def _iter_commits(raw_commits: Iterable[Commit | dict[str, str]]) -> Iterator[Commit]:
     for raw in raw_commits:
         if isinstance(raw, Commit):
-            commits.append(raw)
+            yield raw
             continue
         if not isinstance(raw, dict):
             raise TypeError(f"Unsupported commit shape: {type(raw)}")
         subject = str(raw.get("subject", ""))
         body = str(raw.get("body", ""))
-        commits.append(Commit(subject=subject, body=body))
-    return commits
+        yield Commit(subject, body)
+
+
+def normalize_commits(raw_commits: Iterable[Commit | dict[str, str]]) -> list[Commit]:
+    return list(_iter_commits(raw_commits))
+
+
+def _classify_commit(commit: Commit) -> str | None:
+    """Return "breaking", "feat" or "releasable" for release-triggering commits, else None."""
+    subject = commit.subject.strip()
+    if not subject:
+        return None
+    kind = None
+    if subject.startswith(_FEAT_PREFIXES):
+        kind = "feat"
+    elif subject.startswith(_RELEASABLE_PREFIXES):
+        kind = "releasable"
+    elif not subject.startswith(_SKIPPED_PREFIXES):
+        match = _SUBJECT_LEX.match(subject)
+        if match is not None:
+            if match.group("release"):
+                return None
+            if match.group("breaking"):
+                return "breaking"
+            if match.group("feat"):
+                kind = "feat"
+            elif match.group("releasable"):
+                kind = "releasable"
+    if commit.body and BREAKING_BODY_RE.search(commit.body):
+        return "breaking"
+    return kind
 
 
 def detect_bump(commits: Sequence[Commit]) -> str:
     bump = "patch"
     for commit in commits:
-        subject = commit.subject.strip()
-        if not subject or is_release_commit(subject):
-            continue
-        body = commit.body or ""
-        if BREAKING_SUBJECT_RE.match(subject) or BREAKING_BODY_RE.search(body):
+        kind = _classify_commit(commit)
+        if kind == "breaking":
             return "major"
-        if bump == "patch" and FEATURE_SUBJECT_RE.match(subject):
+        if kind == "feat":
             bump = "minor"
     return bump
 
@@ -87,9 +132,29 @@ def increment_semver(version: str, bump: str) -> str:
     raise ValueError(f"Invalid bump: {bump}")
 
 
-def next_available_version(version: str, existing_tags: Iterable[str], tag_prefix: str = "v") -> str:
+def prepare_tag_set(existing_tags: Iterable[str], tag_prefix: str = "v") -> frozenset[str]:
+    """Normalize tags once so repeated next_available_version calls can reuse them."""
+    prefix_len = len(tag_prefix)
+    return frozenset(
+        tag
+        for tag in (str(raw).strip() for raw in existing_tags)
+        if tag.startswith(tag_prefix) and tag.count(".", prefix_len) == 2
+    )
+
+
+def next_available_version(
+    version: str,
+    existing_tags: Iterable[str],
+    tag_prefix: str = "v",
+    *,
+    prepared_tags: frozenset[str] | None = None,
+) -> str:
     major, minor, patch = parse_semver(version)
-    tag_set = {tag.strip() for tag in existing_tags if str(tag).strip()}
+    if prepared_tags is not None:
+        tag_set: Collection[str] = prepared_tags
+    else:
+        # A one-off lookup does not pay for prepare_tag_set's prefix filtering.
+        tag_set = {tag.strip() for tag in existing_tags if str(tag).strip()}
     candidate = f"{major}.{minor}.{patch}"
     while f"{tag_prefix}{candidate}" in tag_set:
         patch += 1
@@ -99,12 +164,7 @@ def next_available_version(version: str, existing_tags: Iterable[str], tag_prefi
 
 def is_releasable_commit(commit: Commit) -> bool:
     """A commit triggers a release if it is feat/fix/perf or any breaking change."""
-    subject = commit.subject.strip()
-    if not subject or is_release_commit(subject):
-        return False
-    if BREAKING_SUBJECT_RE.match(subject) or BREAKING_BODY_RE.search(commit.body or ""):
-        return True
-    return RELEASABLE_SUBJECT_RE.match(subject) is not None
+    return _classify_commit(commit) is not None
 
 
 def compute_next_version(
@@ -114,55 +174,84 @@ def compute_next_version(
     tag_prefix: str = "v",
 ) -> VersionResult:
     parse_semver(base_version)
-    commits = normalize_commits(raw_commits)
-    release_candidates = [commit for commit in commits if is_releasable_commit(commit)]
-    if not release_candidates:
+    commit_count = 0
+    has_breaking = False
+    has_feat = False
+    for commit in _iter_commits(raw_commits):
+        kind = _classify_commit(commit)
+        if kind is None:
+            continue
+        commit_count += 1
+        if kind == "breaking":
+            has_breaking = True
+        elif kind == "feat":
+            has_feat = True
+    if not commit_count:
         return VersionResult(should_release=False, version=None, bump=None, commit_count=0)
-    bump = detect_bump(release_candidates)
+    bump = "major" if has_breaking else "minor" if has_feat else "patch"
     initial = increment_semver(base_version, bump)
-    version = next_available_version(initial, existing_tags, tag_prefix=tag_prefix)
-    return VersionResult(should_release=True, version=version, bump=bump, commit_count=len(release_candidates))
+    tag_set = prepare_tag_set(existing_tags, tag_prefix)
+    version = next_available_version(initial, (), tag_prefix=tag_prefix, prepared_tags=tag_set)
+    return VersionResult(should_release=True, version=version, bump=bump, commit_count=commit_count)
+
 
+def _run_git_bytes(repo: str | Path, args: Sequence[str]) -> bytes:
+    import subprocess
 
-def _run_git(repo: Path, args: Sequence[str]) -> str:
     result = subprocess.run(
         ["git", "-C", str(repo), *args],
         capture_output=True,
-        text=True,
         check=False,
     )
     if result.returncode != 0:
-        message = result.stderr.strip() or result.stdout.strip() or "git command failed"
-        raise RuntimeError(message)
+        message = result.stderr.strip() or result.stdout.strip() or b"git command failed"
+        raise RuntimeError(message.decode("utf-8", "replace"))
     return result.stdout
 
 
-def load_git_commits(repo: Path, from_ref: str | None, to_ref: str = "HEAD") -> list[Commit]:
+def _run_git(repo: str | Path, args: Sequence[str]) -> str:
+    return _run_git_bytes(repo, args).decode("utf-8", "replace")
+
+
+def load_git_commits(repo: str | Path, from_ref: str | None, to_ref: str = "HEAD") -> list[Commit]:
     rev_range = f"{from_ref}..{to_ref}" if from_ref else to_ref
-    output = _run_git(repo, ["log", "--format=%s%x1f%b%x1e", rev_range])
+    output = _run_git_bytes(repo, ["log", "--format=%s%x1f%b%x1e", rev_range])
     commits: list[Commit] = []
-    for raw_commit in output.split("\x1e"):
-        item = raw_commit.strip("\n")
-        if not item:
-            continue
-        subject, separator, body = item.partition("\x1f")
-        if not separator:
-            body = ""
-        commits.append(Commit(subject=subject.strip(), body=body.rstrip("\n")))
+    start = 0
+    while True:
+        end = output.find(b"\x1e", start)
+        if end < 0:
+            break
+        separator = output.find(b"\x1f", start, end)
+        if separator < 0:
+            subject, body = output[start:end], b""
+        else:
+            subject, body = output[start:separator], output[separator + 1 : end]
+        commits.append(
+            Commit(
+                subject=subject.strip().decode("utf-8", "replace"),
+                body=body.rstrip(b"\n").decode("utf-8", "replace"),
+            )
+        )
+        start = end + 1
     return commits
 
 
-def load_git_tags(repo: Path, pattern: str = "v*") -> list[str]:
+def load_git_tags(repo: str | Path, pattern: str = "v*") -> list[str]:
     output = _run_git(repo, ["tag", "--list", pattern])
     return [line.strip() for line in output.splitlines() if line.strip()]
 
 
+@functools.lru_cache(maxsize=8)
+def _tag_ref_re(prefix: str) -> re.Pattern[str]:
+    return re.compile(rf"^{re.escape(prefix)}([0-9]+\.[0-9]+\.[0-9]+)$")
+
+
 def version_from_tag_ref(ref: str, tag_prefix: str = "v") -> str | None:
     value = ref.strip()
     if value.startswith("refs/tags/"):
         value = value[len("refs/tags/") :]
-    escaped = re.escape(tag_prefix)
-    match = re.match(rf"^{escaped}([0-9]+\.[0-9]+\.[0-9]+)$", value)
+    match = _tag_ref_re(tag_prefix).match(value)
     if not match:
         return None
     return match.group(1)
@@ -170,7 +259,13 @@ def version_from_tag_ref(ref: str, tag_prefix: str = "v") -> str | None:
 
 def emit_result(result: VersionResult, output_format: str, github_output_path: str | None) -> None:
     if output_format == "json":
-        sys.stdout.write(json.dumps(asdict(result)))
+        payload = {
+            "should_release": result.should_release,
+            "version": result.version,
+            "bump": result.bump,
+            "commit_count": result.commit_count,
+        }
+        sys.stdout.write(json.dumps(payload))
         sys.stdout.write("\n")
         return
 
@@ -182,38 +277,64 @@ def emit_result(result: VersionResult, output_format: str, github_output_path: s
         lines.append(f"bump={result.bump}")
     payload = "\n".join(lines) + "\n"
     if github_output_path:
-        with open(github_output_path, "a", encoding="utf-8") as handle:
-            handle.write(payload)
+        data = memoryview(payload.encode("utf-8"))
+        fd = os.open(github_output_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
     else:
         sys.stdout.write(payload)
 
 
-def run_eval_command(args: argparse.Namespace) -> int:
-    with open(args.commits_json, "r", encoding="utf-8") as handle:
-        commits_payload = json.load(handle)
-    if not isinstance(commits_payload, list):
-        raise ValueError("--commits-json must contain a JSON array")
+def _load_json(handle: IO[bytes]) -> Any:
+    """Parse a whole JSON document with orjson when available, else with json."""
+    try:
+        import orjson
+    except ImportError:
+        return json.load(handle)
+    return orjson.loads(handle.read())
+
+
+def _iter_json_array(handle: IO[bytes], option: str) -> Iterator[Any]:
+    """Yield array items lazily with ijson when available, else fall back to _load_json."""
+    try:
+        import ijson
+    except ImportError:
+        payload = _load_json(handle)
+        if not isinstance(payload, list):
+            raise ValueError(f"{option} must contain a JSON array")
+        return iter(payload)
+    events = ijson.parse(handle)
+    first = next(events, None)
+    if first is None or first[1] != "start_array":
+        raise ValueError(f"{option} must contain a JSON array")
+    return ijson.items(events, "item")
 
+
+def run_eval_command(args: argparse.Namespace) -> int:
     tags_payload: list[str] = []
     if args.existing_tags_json:
-        with open(args.existing_tags_json, "r", encoding="utf-8") as handle:
-            tags_data = json.load(handle)
+        with open(args.existing_tags_json, "rb") as handle:
+            tags_data = _load_json(handle)
         if not isinstance(tags_data, list):
             raise ValueError("--existing-tags-json must contain a JSON array")
         tags_payload = [str(item) for item in tags_data]
 
-    result = compute_next_version(
-        base_version=args.base_version,
-        raw_commits=commits_payload,
-        existing_tags=tags_payload,
-        tag_prefix=args.tag_prefix,
-    )
+    with open(args.commits_json, "rb") as handle:
+        result = compute_next_version(
+            base_version=args.base_version,
+            raw_commits=_iter_json_array(handle, "--commits-json"),
+            existing_tags=tags_payload,
+            tag_prefix=args.tag_prefix,
+        )
     emit_result(result, output_format=args.output_format, github_output_path=args.github_output)
     return 0
 
 
 def run_git_command(args: argparse.Namespace) -> int:
-    repo = Path(args.repo).resolve()
+    repo = args.repo
     commits = load_git_commits(repo=repo, from_ref=args.from_ref, to_ref=args.to_ref)
     tags = load_git_tags(repo=repo, pattern=args.tag_pattern)
 
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import json
 import re
+import subprocess
+import sys
+from pathlib import Path
 
 import pytest
 from hypothesis import given
@@ -8,12 +12,18 @@ from hypothesis import settings
 from hypothesis import strategies as st
 
 from standards.versioning.next_version import Commit
+from standards.versioning.next_version import VersionResult
 from standards.versioning.next_version import compute_next_version
 from standards.versioning.next_version import detect_bump
+from standards.versioning.next_version import emit_result
 from standards.versioning.next_version import increment_semver
 from standards.versioning.next_version import is_releasable_commit
+from standards.versioning.next_version import load_git_commits
+from standards.versioning.next_version import main
 from standards.versioning.next_version import next_available_version
 from standards.versioning.next_version import parse_semver
+from standards.versioning.next_version import prepare_tag_set
+from standards.versioning.next_version import version_from_tag_ref
 
 MAX_EXAMPLES = 2_000
 
@@ -109,6 +119,18 @@ def test_major_for_breaking_change_footer() -> None:
     assert result.version == "2.0.0"
 
 
+def test_breaking_footer_must_start_a_line() -> None:
+    assert detect_bump([Commit(subject="fix: a", body="intro\nbreaking-change: dropped flag")]) == "major"
+    assert detect_bump([Commit(subject="fix: a", body="no BREAKING CHANGE: here")]) == "patch"
+
+
+def test_subject_types_match_case_insensitively_like_the_public_patterns() -> None:
+    for subject in ["FIX: a", "f\u0131x: a", "f\u0130x(scope): a", "Perf: a"]:
+        assert is_releasable_commit(Commit(subject=subject))
+    assert detect_bump([Commit(subject="FEAT(scope): a")]) == "minor"
+    assert not is_releasable_commit(Commit(subject="fixup: a"))
+
+
 def test_no_release_when_only_release_commits() -> None:
     commits = [Commit(subject="chore(release): v1.2.4"), Commit(subject="chore(release): v1.2.5")]
     result = compute_next_version("1.2.3", commits, [])
@@ -161,6 +183,173 @@ def test_invalid_semver_raises() -> None:
         parse_semver("1.2")
 
 
+@pytest.mark.parametrize(
+    "value",
+    ["1.2.3.4", "1..3", "v1.2.3", "-1.2.3", "1.2.+3", "1.2. 3", "1.2.\u0663", "1.2.\u00b2"],
+)
+def test_parse_semver_rejects_malformed_parts(value: str) -> None:
+    with pytest.raises(ValueError, match="Invalid semver"):
+        parse_semver(value)
+
+
+def test_next_available_skips_taken_patches_only() -> None:
+    tags = ["v1.3.0", "v1.3.1", " v1.3.2 ", "v1.3.03", "x1.3.3", "v1.4.0", "v1.3.5"]
+    assert next_available_version("1.3.0", tags) == "1.3.3"
+    assert next_available_version("1.3.0", ["x1.3.0"], tag_prefix="x") == "1.3.1"
+
+
+def test_next_available_reuses_prepared_tags() -> None:
+    prepared = prepare_tag_set([" v2.0.0", "v2.0.1 ", "", "  ", "x2.0.2", "v2.0", "nightly"])
+    assert prepared == frozenset({"v2.0.0", "v2.0.1"})
+    assert prepare_tag_set(["app.v1.0.0", "v1.0.0"], tag_prefix="app.v") == frozenset({"app.v1.0.0"})
+    assert next_available_version("2.0.0", [], prepared_tags=prepared) == "2.0.2"
+    assert next_available_version("2.0.1", [], prepared_tags=prepared) == "2.0.2"
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_load_git_commits_parses_subject_and_body(tmp_path: Path) -> None:
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "fix: first")
+    _git(tmp_path, "tag", "v0.1.0")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "feat: second")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "refactor: third\n\nmeta\nBREAKING CHANGE: gone")
+
+    commits = load_git_commits(tmp_path, from_ref="v0.1.0")
+    assert commits == [
+        Commit(subject="refactor: third", body="meta\nBREAKING CHANGE: gone"),
+        Commit(subject="feat: second", body=""),
+    ]
+    assert len(load_git_commits(tmp_path, from_ref=None)) == 3
+
+
+def test_eval_command_reads_commits_json(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    commits_path = tmp_path / "commits.json"
+    commits_path.write_text(json.dumps([{"subject": "feat: add"}, {"subject": "docs: readme", "body": ""}]))
+    tags_path = tmp_path / "tags.json"
+    tags_path.write_text(json.dumps(["v1.3.0"]))
+
+    main(
+        [
+            "eval",
+            "--base-version",
+            "1.2.3",
+            "--commits-json",
+            str(commits_path),
+            "--existing-tags-json",
+            str(tags_path),
+        ]
+    )
+    assert json.loads(capsys.readouterr().out) == {
+        "should_release": True,
+        "version": "1.3.1",
+        "bump": "minor",
+        "commit_count": 1,
+    }
+
+
+def test_eval_command_rejects_non_array_commits(tmp_path: Path) -> None:
+    commits_path = tmp_path / "commits.json"
+    commits_path.write_text(json.dumps({"subject": "feat: add"}))
+    with pytest.raises(ValueError, match="--commits-json must contain a JSON array"):
+        main(["eval", "--base-version", "1.2.3", "--commits-json", str(commits_path)])
+
+
+def _write_eval_inputs(tmp_path: Path) -> list[str]:
+    commits_path = tmp_path / "commits.json"
+    commits = [{"subject": "fix: a"}, {"subject": "docs: b", "body": "BREAKING CHANGE: c"}]
+    commits_path.write_text(json.dumps(commits))
+    tags_path = tmp_path / "tags.json"
+    tags_path.write_text(json.dumps(["v2.0.0"]))
+    return [
+        "eval",
+        "--base-version",
+        "1.2.3",
+        "--commits-json",
+        str(commits_path),
+        "--existing-tags-json",
+        str(tags_path),
+    ]
+
+
+def _spy(monkeypatch: pytest.MonkeyPatch, module: object, name: str) -> list[object]:
+    calls: list[object] = []
+    original = getattr(module, name)
+
+    def wrapper(*args: object, **kwargs: object) -> object:
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, wrapper)
+    return calls
+
+
+def _assert_eval_output(capsys: pytest.CaptureFixture[str]) -> None:
+    assert json.loads(capsys.readouterr().out) == {
+        "should_release": True,
+        "version": "2.0.1",
+        "bump": "major",
+        "commit_count": 2,
+    }
+
+
+def test_eval_command_streams_commits_with_ijson(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    ijson = pytest.importorskip("ijson")
+    calls = _spy(monkeypatch, ijson, "parse")
+    main(_write_eval_inputs(tmp_path))
+    assert len(calls) == 1
+    _assert_eval_output(capsys)
+
+
+def test_eval_command_parses_json_with_orjson(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    orjson = pytest.importorskip("orjson")
+    monkeypatch.setitem(sys.modules, "ijson", None)
+    calls = _spy(monkeypatch, orjson, "loads")
+    main(_write_eval_inputs(tmp_path))
+    assert len(calls) == 2  # tags file and the commits fallback
+    _assert_eval_output(capsys)
+
+
+def test_eval_command_falls_back_to_stdlib_json(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setitem(sys.modules, "ijson", None)
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    main(_write_eval_inputs(tmp_path))
+    _assert_eval_output(capsys)
+
+
+def test_emit_result_appends_github_output(tmp_path: Path) -> None:
+    output_path = tmp_path / "github_output"
+    output_path.write_text("existing=1\n")
+    emit_result(VersionResult(True, "1.3.0", "minor", 2), "github", str(output_path))
+    emit_result(VersionResult(False, None, None, 0), "github", str(output_path))
+    assert output_path.read_text() == (
+        "existing=1\n"
+        "should_release=true\ncommit_count=2\nversion=1.3.0\nbump=minor\n"
+        "should_release=false\ncommit_count=0\n"
+    )
+
+
+def test_version_from_tag_ref() -> None:
+    assert version_from_tag_ref("v1.2.3") == "1.2.3"
+    assert version_from_tag_ref("refs/tags/v1.2.3") == "1.2.3"
+    assert version_from_tag_ref("plugin-v0.4.0", tag_prefix="plugin-v") == "0.4.0"
+    assert version_from_tag_ref("v1.2.3", tag_prefix="plugin-v") is None
+    assert version_from_tag_ref("v1.2") is None
+    assert version_from_tag_ref("v1.2.3-rc.1") is None
+
+
 @settings(max_examples=MAX_EXAMPLES)
 @given(batch=commit_batch())
 def test_property_bump_precedence(batch: tuple[list[Commit], int, bool, bool]) -> None: